@@ -1,15 +1,90 @@
 #!/usr/bin/env python3
 
 import argparse
+import concurrent.futures
+import contextlib
 import os
 from pathlib import Path
 from docx import Document
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
 import shutil
+from io import BytesIO
 import re
+import sys
 import logging
+import logging.handlers
+import multiprocessing
+import zipfile
 from datetime import datetime
 from docx.oxml.shared import qn
 from docx.oxml import OxmlElement
+from lxml import etree
+
+# WordprocessingML namespaces used when probing runs for embedded images
+NSMAP = {
+    'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
+    'wp': 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing',
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+}
+EMBED_QN = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed'
+
+# Compiled once at import; evaluated against each w:drawing element
+_XP_INLINE_OR_ANCHOR = etree.XPath('.//wp:inline|.//wp:anchor', namespaces=NSMAP)
+_XP_BLIP = etree.XPath('.//a:blip', namespaces=NSMAP)
+_XP_DOCPR = etree.XPath('.//wp:docPr', namespaces=NSMAP)
+
+# Heading detection: named styles map straight to a level, otherwise fall back
+# to run formatting. Font sizes are in half-points, as stored in w:sz.
+_HEADING_STYLES = {f'Heading {i}': i for i in range(1, 10)}
+_HEADING_STYLES['Title'] = 1
+_HEADING_SIZE_THRESHOLDS = [(40, 1), (32, 2), (28, 3)]
+_W_VAL = qn('w:val')
+_W_SZ_TAG = qn('w:sz')
+_W_B_TAG = qn('w:b')
+_W_P_TAG = qn('w:p')
+_W_R_TAG = qn('w:r')
+_W_RPR_TAG = qn('w:rPr')
+_W_DRAWING_TAG = qn('w:drawing')
+
+# Image extensions kept as-is when extracting; anything else is saved as PNG
+_IMG_EXTS = frozenset(('png', 'jpg', 'jpeg', 'gif', 'bmp'))
+# Flattens line breaks and tabs in image alt text to single spaces
+_ALT_TRANS = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+# Images larger than this are copied out in chunks rather than one write
+_LARGE_IMAGE_BYTES = 16 * 1024 * 1024
+
+# Paragraphs set entirely in one of these fonts are treated as code
+_MONO_FONTS = frozenset(('Consolas', 'Courier New'))
+
+def _configure_oxml_parser():
+    """Swap python-docx's lxml parser for one that drops comments and PIs"""
+    try:
+        # python-docx >= 1.0 keeps the parser in its own module
+        from docx.oxml import parser as docx_parser
+    except ImportError:
+        # 0.8.x defines it, and the parse_xml that reads it, in docx.oxml
+        import docx.oxml as docx_parser
+    if not (hasattr(docx_parser, 'oxml_parser') and
+            hasattr(docx_parser, 'element_class_lookup')):
+        return False
+    
+    oxml_parser = etree.XMLParser(
+        remove_blank_text=True,
+        remove_comments=True,
+        remove_pis=True,
+        resolve_entities=False,
+        huge_tree=True,
+        collect_ids=False,
+    )
+    # Keep python-docx's custom element classes (CT_P, CT_R, ...)
+    oxml_parser.set_element_class_lookup(docx_parser.element_class_lookup)
+    docx_parser.oxml_parser = oxml_parser
+    return True
+
+# Done at import so spawned worker processes pick it up as well; a failure
+# is reported from main() once logging is configured
+_OXML_PARSER_CONFIGURED = _configure_oxml_parser()
 
 class ConversionStats:
     def __init__(self):
@@ -19,6 +94,14 @@ class ConversionStats:
         self.total_images = 0
         self.failed_images = []
         self.file_image_counts = {}  # Track images per file
+    
+    def merge(self, other):
+        """Fold per-file results from a worker process into these stats"""
+        self.successful_files.extend(other.successful_files)
+        self.failed_files.extend(other.failed_files)
+        self.total_images += other.total_images
+        self.failed_images.extend(other.failed_images)
+        self.file_image_counts.update(other.file_image_counts)
 
 def setup_logging(log_dir):
     """Setup logging to both console and file"""
@@ -40,44 +123,38 @@ def setup_logging(log_dir):
     
     return logging.getLogger(__name__)
 
-def get_heading_level(paragraph):
+def get_heading_level(paragraph, logger=logging.getLogger(__name__)):
     """Determine the correct heading level based on the Word document structure"""
     try:
-        style_name = paragraph.style.name
-        if style_name.startswith('Heading'):
-            return int(style_name.split()[-1])
-        elif style_name == 'Title':
-            return 1
+        level = _HEADING_STYLES.get(paragraph.style.name)
+        if level is not None:
+            return level
         
         if hasattr(paragraph, '_element'):
             properties = paragraph._element.get_or_add_pPr()
             if properties is not None:
                 run_props = None
-                for run in paragraph.runs:
-                    if hasattr(run, '_element') and run._element.rPr is not None:
-                        run_props = run._element.rPr
+                for r_el in paragraph._element.iterchildren(_W_R_TAG):
+                    run_props = r_el.find(_W_RPR_TAG)
+                    if run_props is not None:
                         break
                 
                 if run_props is not None:
                     # Check font size if available
-                    sz_elem = run_props.find('.//w:sz', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'})
+                    sz_elem = run_props.find(_W_SZ_TAG)
                     if sz_elem is not None:
-                        size = int(sz_elem.get(qn('w:val'))) // 2
-                        if size >= 20:
-                            return 1
-                        elif size >= 16:
-                            return 2
-                        elif size >= 14:
-                            return 3
+                        half_points = int(sz_elem.get(_W_VAL))
+                        for threshold, level in _HEADING_SIZE_THRESHOLDS:
+                            if half_points >= threshold:
+                                return level
                 
                     # Check if it's bold and might be a heading
-                    b_elem = run_props.find('.//w:b', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'})
-                    if b_elem is not None:
+                    if run_props.find(_W_B_TAG) is not None:
                         return 3
         
         return 0
     except Exception as e:
-        logging.warning(f"Error determining heading level: {str(e)}")
+        logger.warning("Error determining heading level: %s", e)
         return 0
 
 def extract_images(doc, image_dir, doc_name, logger, stats):
@@ -85,11 +162,22 @@ def extract_images(doc, image_dir, doc_name, logger, stats):
     image_refs = {}
     file_image_count = 0  # Counter for this specific file
     
+    # Text-only documents: no rels to walk and no images directory to create
+    rels = doc.part.rels.values()
+    if not any(rel.reltype.endswith('/image') for rel in rels):
+        stats.file_image_counts[doc_name] = 0
+        return image_refs
+    made_dir = False
+    
+    # image_dir is fixed for the whole loop, so join by plain concatenation
+    join_prefix = image_dir + os.sep
+    
     try:
-        for rel in doc.part.rels.values():
+        for rel in rels:
             # Only process image relationships and verify the target exists
-            if ("image" in rel.reltype and 
-                hasattr(rel, 'target_part') and 
+            if not rel.reltype.endswith('/image'):
+                continue
+            if (hasattr(rel, 'target_part') and 
                 hasattr(rel.target_part, 'blob')):
                 try:
                     # Get image extension
@@ -97,22 +185,28 @@ def extract_images(doc, image_dir, doc_name, logger, stats):
                     if not image_data:  # Skip if no actual image data
                         continue
                         
-                    image_ext = rel.target_ref.split('.')[-1].lower()
+                    image_ext = sys.intern(rel.target_ref.rpartition('.')[2].lower())
                     
                     # Validate image extension
-                    if image_ext not in ['png', 'jpg', 'jpeg', 'gif', 'bmp']:
+                    if image_ext not in _IMG_EXTS:
                         image_ext = 'png'  # Default to PNG for unknown types
                     
                     file_image_count += 1  # Increment counter for this file
                     image_filename = f"{doc_name}_image_{file_image_count}.{image_ext}"
                     
-                    # Save image
-                    image_path = os.path.join(image_dir, image_filename)
-                    with open(image_path, 'wb') as img_file:
-                        img_file.write(image_data)
+                    # Save image, creating the images directory on first use
+                    if not made_dir:
+                        os.makedirs(image_dir, exist_ok=True)
+                        made_dir = True
+                    image_path = join_prefix + image_filename
+                    if len(image_data) > _LARGE_IMAGE_BYTES:
+                        with open(image_path, 'wb') as img_file:
+                            shutil.copyfileobj(BytesIO(image_data), img_file)
+                    else:
+                        Path(image_path).write_bytes(image_data)
                     
-                    image_refs[rel.rId] = f"./images/{image_filename}"
-                    logger.debug(f"Saved image: {image_filename}")
+                    image_refs[sys.intern(rel.rId)] = f"./images/{image_filename}"
+                    logger.debug("Saved image: %s", image_filename)
                 
                 except Exception as e:
                     error_msg = f"Failed to extract image {file_image_count} from {doc_name}: {str(e)}"
@@ -124,7 +218,7 @@ def extract_images(doc, image_dir, doc_name, logger, stats):
         stats.total_images += file_image_count
         
         if file_image_count > 0:
-            logger.info(f"Extracted {file_image_count} images from {doc_name}")
+            logger.info("Extracted %d images from %s", file_image_count, doc_name)
         
         return image_refs
     
@@ -134,10 +228,10 @@ def extract_images(doc, image_dir, doc_name, logger, stats):
         stats.failed_images.append((doc_name, error_msg))
         return image_refs
 
-def convert_to_markdown(doc_path, output_dir, logger, stats):
+def convert_to_markdown(doc_path, output_dir, logger, stats, target_dir=None):
     """Convert a single Word document to Markdown"""
     try:
-        logger.info(f"Converting {doc_path} to markdown")
+        logger.info("Converting %s to markdown", doc_path)
         
         # Validate file exists and is readable
         if not os.path.exists(doc_path):
@@ -148,58 +242,107 @@ def convert_to_markdown(doc_path, output_dir, logger, stats):
         if file_size == 0:
             raise ValueError(f"File is empty: {doc_path}")
             
-        try:
-            doc = Document(doc_path)
-        except Exception as e:
-            if "Package not found" in str(e):
+        # Open once: sniff the ZIP header (valid .docx files are ZIP archives)
+        # and hand the same handle to python-docx
+        with open(doc_path, 'rb') as f:
+            header = f.read(4)
+            if header != b'PK\x03\x04':
                 raise ValueError(
-                    f"File appears to be corrupted or not a valid Word document: {doc_path}\n"
-                    f"Please ensure the file is a valid .docx file and not password protected."
+                    f"File has .docx extension but is not a valid Word document: {doc_path}\n"
+                    "File may be corrupted or in an older .doc format."
                 )
-            raise
+            f.seek(0)
+            
+            try:
+                doc = Document(f)
+            except Exception as e:
+                # A stream skips python-docx's is_zipfile check, so a corrupt
+                # archive surfaces as BadZipFile rather than "Package not found"
+                if isinstance(e, zipfile.BadZipFile) or "Package not found" in str(e):
+                    raise ValueError(
+                        f"File appears to be corrupted or not a valid Word document: {doc_path}\n"
+                        f"Please ensure the file is a valid .docx file and not password protected."
+                    )
+                raise
             
-        doc_name = Path(doc_path).stem
+        doc_name = sys.intern(Path(doc_path).stem)
         
-        # Create relative output directory structure
-        rel_path = os.path.relpath(os.path.dirname(doc_path), start=os.path.dirname(output_dir))
-        target_dir = os.path.join(output_dir, rel_path)
-        os.makedirs(target_dir, exist_ok=True)
+        # Create relative output directory structure, only now that the
+        # document has loaded, and at most once per directory per process
+        if target_dir is None:
+            target_dir = _target_dir_for(doc_path, output_dir)
+        if target_dir not in _created_dirs:
+            os.makedirs(target_dir, exist_ok=True)
+            _created_dirs.add(target_dir)
         
-        # Create images directory if it doesn't exist
+        # Extract images (the images directory is created only if needed)
         image_dir = os.path.join(target_dir, "images")
-        os.makedirs(image_dir, exist_ok=True)
-        
-        # Extract images
         image_refs = extract_images(doc, image_dir, doc_name, logger, stats)
         
-        # Create markdown content
-        md_content = []
-        in_code_block = False
+        # Stream markdown straight to the output file, collapsing runs of
+        # blank lines as they are emitted
+        output_path = os.path.join(target_dir, f"{doc_name}.md")
+        md_file = open(output_path, 'w', encoding='utf-8')
+        completed = False
+        last_was_blank = False
+        first_line = True
         
-        for paragraph in doc.paragraphs:
-            # Collect paragraph content in order
-            paragraph_content = []
+        def emit(line):
+            nonlocal last_was_blank, first_line
+            if line.strip():
+                last_was_blank = False
+            elif last_was_blank:
+                return
+            else:
+                last_was_blank = True
+            if not first_line:
+                md_file.write('\n')
+            md_file.write(line)
+            first_line = False
+        
+        try:
+            in_code_block = False
             
-            for run in paragraph.runs:
-                has_image = False
+            body = doc.element.body
+            
+            # Map each run to its drawings in one pass over the body, so runs
+            # without images (nearly all of them) skip the search entirely.
+            # Keyed by element rather than id() so the lxml proxies stay alive.
+            drawing_map = {}
+            for drawing in body.iter(_W_DRAWING_TAG):
+                run_el = drawing.getparent()
+                while run_el is not None and run_el.tag != _W_R_TAG:
+                    run_el = run_el.getparent()
+                if run_el is not None:
+                    drawing_map.setdefault(run_el, []).append(drawing)
+            
+            # Wrap body paragraphs lazily rather than materialising doc.paragraphs
+            para_parent = doc._body
+            for p_el in body.iterchildren(_W_P_TAG):
+                paragraph = Paragraph(p_el, para_parent)
+                # Collect paragraph content in order
+                paragraph_content = []
+            
+                # Walk w:r children directly; no Run wrappers are needed here
+                for r_el in p_el.iterchildren(_W_R_TAG):
+                    has_image = False
                 
-                # Check for images in this run
-                if hasattr(run, '_element'):
-                    for element in run._element.findall('.//w:drawing', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}):
+                    # Check for images in this run
+                    for element in drawing_map.get(r_el, ()):
                         try:
-                            inline_or_anchor = element.find('.//wp:inline', {'wp': 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing'})
-                            if inline_or_anchor is None:
-                                inline_or_anchor = element.find('.//wp:anchor', {'wp': 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing'})
-                            
-                            if inline_or_anchor is not None:
-                                blip = inline_or_anchor.find('.//a:blip', {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'})
-                                if blip is not None:
-                                    rId = blip.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed')
+                            inline_or_anchor = _XP_INLINE_OR_ANCHOR(element)
+                        
+                            if inline_or_anchor:
+                                inline_or_anchor = inline_or_anchor[0]
+                                blip = _XP_BLIP(inline_or_anchor)
+                                if blip:
+                                    rId = sys.intern(blip[0].get(EMBED_QN, ''))
                                     if rId in image_refs:
-                                        docPr = inline_or_anchor.find('.//wp:docPr', {'wp': 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing'})
+                                        docPr = _XP_DOCPR(inline_or_anchor)
+                                        docPr = docPr[0] if docPr else None
                                         alt_text = docPr.get('descr', 'Image') if docPr is not None else 'Image'
-                                        alt_text = alt_text.replace('\n', ' ').strip()
-                                        
+                                        alt_text = alt_text.translate(_ALT_TRANS).strip()
+                                    
                                         # Store the image markdown
                                         paragraph_content.append({
                                             'type': 'image',
@@ -207,86 +350,84 @@ def convert_to_markdown(doc_path, output_dir, logger, stats):
                                         })
                                         has_image = True
                         except Exception as e:
-                            logger.warning(f"Failed to process inline image in {doc_name}: {str(e)}")
+                            logger.warning("Failed to process inline image in %s: %s", doc_name, e)
                 
-                # If run has text and wasn't completely replaced by an image
-                if run.text.strip() and not has_image:
-                    paragraph_content.append({
-                        'type': 'text',
-                        'content': run.text
-                    })
+                    # If run has text and wasn't completely replaced by an image
+                    run_text = r_el.text
+                    if run_text.strip() and not has_image:
+                        paragraph_content.append({
+                            'type': 'text',
+                            'content': run_text
+                        })
             
-            # Process the collected content
-            if paragraph_content:
-                # Check if paragraph is a heading
-                heading_level = get_heading_level(paragraph)
-                if heading_level > 0:
-                    if in_code_block:
-                        md_content.append("```")
-                        md_content.append("")
-                        in_code_block = False
-                    
-                    # Combine all text content for heading
-                    heading_text = ''.join(item['content'] for item in paragraph_content if item['type'] == 'text')
-                    md_content.append(f"{'#' * heading_level} {heading_text}")
-                else:
-                    # Handle regular paragraph or code block
-                    is_code = (
-                        paragraph.style.name.lower().startswith('code') or
-                        all(run.font.name in ['Consolas', 'Courier New'] for run in paragraph.runs if run.font)
-                    )
-                    
-                    if is_code:
-                        if not in_code_block:
-                            md_content.append("")
-                            md_content.append("```")
-                            in_code_block = True
-                        # Combine all text content for code
-                        code_text = ''.join(item['content'] for item in paragraph_content if item['type'] == 'text')
-                        md_content.append(code_text.replace('\t', '    '))
-                    else:
+                # Process the collected content
+                if paragraph_content:
+                    # Check if paragraph is a heading
+                    heading_level = get_heading_level(paragraph, logger)
+                    if heading_level > 0:
                         if in_code_block:
-                            md_content.append("```")
-                            md_content.append("")
+                            emit("```")
+                            emit("")
                             in_code_block = False
-                        
-                        # If paragraph contains only one image
-                        if len(paragraph_content) == 1 and paragraph_content[0]['type'] == 'image':
-                            md_content.append("")
-                            md_content.append(paragraph_content[0]['content'])
-                            md_content.append("")
+                    
+                        # Combine all text content for heading
+                        heading_text = ''.join(item['content'] for item in paragraph_content if item['type'] == 'text')
+                        emit(f"{'#' * heading_level} {heading_text}")
+                    else:
+                        # Handle regular paragraph or code block
+                        style_lower = paragraph.style.name.lower()
+                        is_code = style_lower.startswith('code')
+                        if not is_code:
+                            is_code = True
+                            for r_el in p_el.iterchildren(_W_R_TAG):
+                                if Run(r_el, paragraph).font.name not in _MONO_FONTS:
+                                    is_code = False
+                                    break
+                    
+                        if is_code:
+                            if not in_code_block:
+                                emit("")
+                                emit("```")
+                                in_code_block = True
+                            # Combine all text content for code
+                            code_text = ''.join(item['content'] for item in paragraph_content if item['type'] == 'text')
+                            emit(code_text.replace('\t', '    '))
                         else:
-                            # Combine content preserving order
-                            combined_content = ''.join(item['content'] for item in paragraph_content)
-                            if combined_content.strip():
-                                md_content.append(combined_content)
-            else:
-                # Handle empty lines
-                if not in_code_block:
-                    md_content.append("")
-        
-        # Close any open code block
-        if in_code_block:
-            md_content.append("```")
-            md_content.append("")
+                            if in_code_block:
+                                emit("```")
+                                emit("")
+                                in_code_block = False
+                        
+                            # If paragraph contains only one image
+                            if len(paragraph_content) == 1 and paragraph_content[0]['type'] == 'image':
+                                emit("")
+                                emit(paragraph_content[0]['content'])
+                                emit("")
+                            else:
+                                # Combine content preserving order
+                                combined_content = ''.join(item['content'] for item in paragraph_content)
+                                if combined_content.strip():
+                                    emit(combined_content)
+                else:
+                    # Handle empty lines
+                    if not in_code_block:
+                        emit("")
         
-        # Clean up multiple consecutive blank lines
-        cleaned_content = []
-        last_was_blank = False
-        for line in md_content:
-            if line.strip():
-                cleaned_content.append(line)
-                last_was_blank = False
-            elif not last_was_blank:
-                cleaned_content.append(line)
-                last_was_blank = True
+            # Close any open code block
+            if in_code_block:
+                emit("```")
+                emit("")
         
-        # Save markdown file
-        output_path = os.path.join(target_dir, f"{doc_name}.md")
-        with open(output_path, 'w', encoding='utf-8') as md_file:
-            md_file.write('\n'.join(cleaned_content))
+            completed = True
+        finally:
+            md_file.close()
+            # Don't leave a truncated markdown file behind on failure
+            if not completed:
+                # Never let cleanup mask the error that got us here
+                with contextlib.suppress(OSError):
+                    os.remove(output_path)
         
-        logger.info(f"Successfully converted {doc_path} to {output_path}")
+        logger.info("Successfully converted %s to %s", doc_path, output_path)
         stats.successful_files.append(doc_path)
         return output_path
     
@@ -308,40 +449,118 @@ def convert_to_markdown(doc_path, output_dir, logger, stats):
         stats.failed_files.append((doc_path, str(e)))
         raise
 
+def _iter_docs(root):
+    """Yield Word document paths under root, recursing lazily with scandir"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        # Unreadable directories are skipped, as os.walk would
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_docs(entry.path)
+            elif entry.is_file() and entry.name.endswith(('.doc', '.docx')):
+                yield entry.path
+
+# Output directories already created by this process
+_created_dirs = set()
+
+def _target_dir_for(doc_path, output_dir):
+    """Output directory mirroring the source document's location"""
+    rel_path = os.path.relpath(os.path.dirname(doc_path), start=os.path.dirname(output_dir))
+    return os.path.join(output_dir, rel_path)
+
+def _init_worker_logging(log_queue, level):
+    """Forward a worker process's log records to the parent's handlers"""
+    root = logging.getLogger()
+    # Drop any handlers inherited via fork so records are written only once
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+def _convert_worker(doc_path, output_dir, target_dir):
+    """Convert a single document in a worker process and return its own stats"""
+    stats = ConversionStats()
+    logger = logging.getLogger(__name__)
+    try:
+        output_path = convert_to_markdown(doc_path, output_dir, logger, stats, target_dir)
+        return output_path, stats, None
+    except Exception as e:
+        return None, stats, str(e)
+
 def process_directory(source_dir, output_dir, logger, stats):
     """Process directory recursively maintaining directory structure"""
     converted_files = []
     skipped_files = []
+    doc_paths = []
+    dir_cache = {}  # source parent dir -> target dir
     
     logger.info(f"Processing directory: {source_dir}")
-    for root, _, files in os.walk(source_dir):
-        for file in files:
-            if file.endswith(('.doc', '.docx')):
-                stats.total_files += 1
-                doc_path = os.path.join(root, file)
-                try:
-                    # Check if file is actually a Word document
-                    with open(doc_path, 'rb') as f:
-                        header = f.read(4)
-                        # Check for ZIP header (valid .docx files are ZIP archives)
-                        if header != b'PK\x03\x04':
-                            error_msg = (
-                                f"File has .docx extension but is not a valid Word document: {doc_path}\n"
-                                "File may be corrupted or in an older .doc format."
-                            )
-                            logger.error(error_msg)
-                            stats.failed_files.append((doc_path, error_msg))
-                            skipped_files.append(doc_path)
-                            continue
-                    
-                    output_path = convert_to_markdown(doc_path, output_dir, logger, stats)
-                    converted_files.append((doc_path, output_path))
-                    
-                except Exception as e:
-                    logger.error(f"Failed to convert {doc_path}: {str(e)}")
-                    if doc_path not in skipped_files:
-                        skipped_files.append(doc_path)
-                    continue
+    for doc_path in _iter_docs(source_dir):
+        stats.total_files += 1
+        # Resolve each output directory once, however many documents share it
+        parent = os.path.dirname(doc_path)
+        target_dir = dir_cache.get(parent)
+        if target_dir is None:
+            try:
+                target_dir = _target_dir_for(doc_path, output_dir)
+            except ValueError as e:
+                # Leave it to convert_to_markdown to retry and report per file
+                logger.warning("Could not resolve output directory for %s: %s", parent, e)
+            else:
+                dir_cache[parent] = target_dir
+        doc_paths.append((doc_path, target_dir))
+    
+    results = []
+    if len(doc_paths) == 1:
+        # Not worth starting a worker process for a single document
+        doc_path, target_dir = doc_paths[0]
+        results.append((doc_path, _convert_worker(doc_path, output_dir, target_dir)))
+    elif doc_paths:
+        # Documents are independent, so convert them across processes.
+        # python-docx is not thread-safe, but separate processes are fine.
+        # Worker log records are routed back here so they reach the same
+        # handlers regardless of the platform's process start method.
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(
+            log_queue, *logging.getLogger().handlers, respect_handler_level=True
+        )
+        listener.start()
+        try:
+            max_workers = min(os.cpu_count() or 1, len(doc_paths))
+            if sys.platform == 'win32':
+                # ProcessPoolExecutor rejects more than 61 workers on Windows
+                max_workers = min(61, max_workers)
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker_logging,
+                initargs=(log_queue, logger.getEffectiveLevel()),
+            ) as executor:
+                futures = [
+                    (doc_path, executor.submit(_convert_worker, doc_path, output_dir, target_dir))
+                    for doc_path, target_dir in doc_paths
+                ]
+                # Collect in submission order so the summary is stable between runs
+                for doc_path, future in futures:
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # The worker itself died, so nothing was recorded for this file
+                        result = (None, None, str(e))
+                        stats.failed_files.append((doc_path, str(e)))
+                    results.append((doc_path, result))
+        finally:
+            listener.stop()
+    
+    for doc_path, (output_path, file_stats, error) in results:
+        if file_stats is not None:
+            stats.merge(file_stats)
+        
+        if error is None:
+            converted_files.append((doc_path, output_path))
+        else:
+            logger.error(f"Failed to convert {doc_path}: {error}")
+            skipped_files.append(doc_path)
     
     if skipped_files:
         logger.warning("\nSkipped files:")
@@ -412,6 +631,9 @@ def main():
     logger = setup_logging(args.log_dir)
     stats = ConversionStats()
     
+    if not _OXML_PARSER_CONFIGURED:
+        logger.warning("python-docx parser internals have moved; using its default XML parser")
+    
     try:
         # Create target directory if it doesn't exist
         os.makedirs(args.target, exist_ok=True)